@@ -0,0 +1,33 @@
+"""Data product info native UUID primary key
+
+Revision ID: 08fff96c7979
+Revises: 40319117a7ba
+Create Date: 2026-10-15 09:48:03.117462
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '08fff96c7979'
+down_revision: Union[str, None] = '40319117a7ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('data_product_info', 'id', type_=postgresql.UUID(as_uuid=True), postgresql_using='id::uuid')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('data_product_info', 'id', type_=sa.String(), postgresql_using='id::text')
@@ -0,0 +1,51 @@
+"""Data product JSON columns to JSONB
+
+Revision ID: 40319117a7ba
+Revises: d347bdebec4d
+Create Date: 2026-10-15 09:12:44.512903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '40319117a7ba'
+down_revision: Union[str, None] = 'd347bdebec4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = {
+    'data_products': ('links', 'custom'),
+    'input_ports': ('links', 'custom'),
+    'output_ports': ('server', 'links', 'custom'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table, column,
+                type_=postgresql.JSONB(),
+                server_default=sa.text("'{}'::jsonb"),
+                # Cast via text so this also runs on databases whose columns create_all already made jsonb
+                postgresql_using=f"COALESCE(NULLIF({column}::text, ''), '{{}}')::jsonb",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            # Drop the jsonb default before the type change so it does not need casting
+            op.alter_column(table, column, server_default=None)
+            op.alter_column(table, column, type_=sa.String(), postgresql_using=f"{column}::text")
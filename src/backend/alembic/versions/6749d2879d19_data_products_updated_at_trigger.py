@@ -0,0 +1,49 @@
+"""Data products statement timestamps and updated_at trigger
+
+Revision ID: 6749d2879d19
+Revises: 8ea2161a634f
+Create Date: 2026-10-15 11:02:44.518907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6749d2879d19'
+down_revision: Union[str, None] = '8ea2161a634f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in ('created_at', 'updated_at'):
+        op.alter_column('data_products', column, server_default=sa.text('statement_timestamp()'))
+    op.execute("""
+        CREATE OR REPLACE FUNCTION data_products_set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = statement_timestamp();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_data_products_updated_at ON data_products")
+    op.execute(
+        "CREATE TRIGGER trg_data_products_updated_at BEFORE UPDATE ON data_products "
+        "FOR EACH ROW EXECUTE FUNCTION data_products_set_updated_at()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP TRIGGER IF EXISTS trg_data_products_updated_at ON data_products")
+    op.execute("DROP FUNCTION IF EXISTS data_products_set_updated_at()")
+    for column in ('created_at', 'updated_at'):
+        op.alter_column('data_products', column, server_default=sa.func.now())
@@ -0,0 +1,56 @@
+"""Data product composite indexes
+
+Revision ID: 8ea2161a634f
+Revises: 08fff96c7979
+Create Date: 2026-10-15 10:21:37.640218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8ea2161a634f'
+down_revision: Union[str, None] = '08fff96c7979'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REPLACED_INDEXES = {
+    'data_product_info': ('domain', 'owner_team_id'),
+    'input_ports': ('asset_type', 'asset_identifier'),
+    'output_ports': ('asset_type', 'asset_identifier'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.create_index('ix_data_product_info_domain_status', 'data_product_info', ['domain', 'status'],
+                    postgresql_include=['data_product_id'], if_not_exists=True)
+    op.create_index('ix_data_product_info_team_status', 'data_product_info', ['owner_team_id', 'status'],
+                    if_not_exists=True)
+    for table in ('input_ports', 'output_ports'):
+        op.create_index(f'ix_{table}_asset', table, ['asset_identifier', 'asset_type'],
+                        postgresql_include=['data_product_id'], if_not_exists=True)
+        op.create_index(f'ix_{table}_data_product_id', table, ['data_product_id'], if_not_exists=True)
+
+    for table, columns in REPLACED_INDEXES.items():
+        for column in columns:
+            op.drop_index(f'ix_{table}_{column}', table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, columns in REPLACED_INDEXES.items():
+        for column in columns:
+            op.create_index(f'ix_{table}_{column}', table, [column], if_not_exists=True)
+
+    for table in ('input_ports', 'output_ports'):
+        op.drop_index(f'ix_{table}_data_product_id', table_name=table, if_exists=True)
+        op.drop_index(f'ix_{table}_asset', table_name=table, if_exists=True)
+    op.drop_index('ix_data_product_info_team_status', table_name='data_product_info', if_exists=True)
+    op.drop_index('ix_data_product_info_domain_status', table_name='data_product_info', if_exists=True)
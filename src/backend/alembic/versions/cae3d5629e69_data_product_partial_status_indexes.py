@@ -0,0 +1,41 @@
+"""Data product partial status indexes
+
+Revision ID: cae3d5629e69
+Revises: 6749d2879d19
+Create Date: 2026-10-15 11:48:12.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cae3d5629e69'
+down_revision: Union[str, None] = '6749d2879d19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_INDEXES = {
+    'data_product_info': 'ix_data_product_info_status',
+    'output_ports': 'ix_output_ports_status',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, index_name in STATUS_INDEXES.items():
+        op.drop_index(index_name, table_name=table, if_exists=True)
+        op.create_index(index_name, table, ['status'], postgresql_where=sa.text('status IS NOT NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, index_name in STATUS_INDEXES.items():
+        op.drop_index(index_name, table_name=table, if_exists=True)
+        op.create_index(index_name, table, ['status'])
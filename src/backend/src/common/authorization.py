@@ -204,6 +204,36 @@ class PermissionChecker:
         self.required_level = required_level
         logger.debug(f"PermissionChecker initialized for feature '{self.feature_id}' requiring level '{self.required_level.value}'")
 
+    @staticmethod
+    async def _get_effective_permissions(
+        request: Request,
+        user_details: UserInfo,
+        auth_manager: AuthorizationManager
+    ) -> Dict[str, FeatureAccessLevel]:
+        """Resolves the user's effective permissions once per request.
+
+        Several PermissionChecker dependencies can run for one request; the team
+        override lookup (a DB query) and permission merge are shared via request.state.
+        """
+        cache: Dict[str, Dict[str, FeatureAccessLevel]] = getattr(request.state, 'effective_permissions_cache', None)
+        if cache is None:
+            cache = {}
+            request.state.effective_permissions_cache = cache
+
+        user_key = user_details.email or user_details.user or ''
+        if user_key not in cache:
+            # Check for team role overrides
+            team_role_override = await get_user_team_role_overrides(
+                user_details.email,
+                user_details.groups or [],
+                request
+            )
+            cache[user_key] = auth_manager.get_user_effective_permissions(
+                user_details.groups,
+                team_role_override
+            )
+        return cache[user_key]
+
     async def __call__(
         self,
         request: Request, # Inject request to potentially access app state
@@ -221,17 +251,7 @@ class PermissionChecker:
             )
 
         try:
-            # Check for team role overrides
-            team_role_override = await get_user_team_role_overrides(
-                user_details.email,
-                user_details.groups or [],
-                request
-            )
-
-            effective_permissions = auth_manager.get_user_effective_permissions(
-                user_details.groups,
-                team_role_override
-            )
+            effective_permissions = await self._get_effective_permissions(request, user_details, auth_manager)
             has_required_permission = auth_manager.has_permission(
                 effective_permissions,
                 self.feature_id,
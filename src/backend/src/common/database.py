@@ -358,7 +358,10 @@ def init_db() -> None:
                                 pool_size=5, 
                                 max_overflow=10,
                                 pool_recycle=840,
-                                pool_pre_ping=True)
+                                pool_pre_ping=True,
+                                # Reuse the most recently returned connection so a few stay warm
+                                # (server caches) and surplus ones idle out instead of rotating
+                                pool_use_lifo=True)
         engine = _engine # Assign to public variable
 
         # Explicitly enforce search_path at connection time to ensure correct schema usage in environments
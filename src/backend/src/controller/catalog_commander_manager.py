@@ -1,12 +1,60 @@
-from typing import Any, Dict, List
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, List, Tuple
 
 from databricks.sdk import WorkspaceClient
 from urllib.parse import quote
 
 from ..common.logging import get_logger
+from ..models.catalog_commander import CatalogNode
 
 logger = get_logger(__name__)
 
+# Catalog/schema/table listings change on the minute timescale at most, while the
+# UI re-requests the same tree nodes constantly. The manager is created per request,
+# so the cache lives at module level and is shared across requests.
+LISTING_CACHE_TTL_SECONDS = 60
+# Keys include catalog and schema names, so the number of entries is bounded LRU-style.
+LISTING_CACHE_MAX_ENTRIES = 1024
+_listing_cache: "OrderedDict[Tuple[str, ...], Tuple[float, Any]]" = OrderedDict()
+_listing_cache_lock = threading.Lock()
+
+# CachingWorkspaceClient's tables.list only takes catalog and schema names, so it cannot
+# forward omit_columns/omit_properties/omit_username; the tree only needs names and types,
+# so tables are listed through the raw API client instead.
+TABLES_API_PATH = '/api/2.1/unity-catalog/tables'
+TABLES_PAGE_SIZE = 1000
+
+
+def _ttl_cached(kind: str) -> Callable:
+    """Cache a listing method's result for LISTING_CACHE_TTL_SECONDS, keyed by kind and arguments."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args):
+            key = (kind, *args)
+            now = time.monotonic()
+            with _listing_cache_lock:
+                entry = _listing_cache.get(key)
+                if entry is not None:
+                    _listing_cache.move_to_end(key)
+            if entry is not None and entry[0] > now:
+                logger.debug(f"Listing cache hit for {key}")
+                return entry[1]
+
+            result = func(self, *args)
+            with _listing_cache_lock:
+                _listing_cache[key] = (now + LISTING_CACHE_TTL_SECONDS, result)
+                _listing_cache.move_to_end(key)
+                while len(_listing_cache) > LISTING_CACHE_MAX_ENTRIES:
+                    _listing_cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+
 class CatalogCommanderManager:
     """Manages catalog operations and queries."""
 
@@ -20,24 +68,27 @@ class CatalogCommanderManager:
         self.client = client
         logger.debug("CatalogCommanderManager initialized successfully")
 
-    def list_catalogs(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all cached catalog/schema/table listings (call after any write to the catalog)."""
+        with _listing_cache_lock:
+            _listing_cache.clear()
+
+    @_ttl_cached('catalogs')
+    def list_catalogs(self) -> List[CatalogNode]:
         """List all catalogs in the Databricks workspace.
         
         Returns:
-            List of catalog information dictionaries
+            List of catalog nodes
         """
         try:
             logger. debug("Fetching all catalogs from Databricks workspace")
             catalogs = list(self.client.catalogs.list())  # Convert generator to list
             logger.debug(f"Retrieved {len(catalogs)} catalogs from Databricks")
 
-            result = [{
-                'id': catalog.name,
-                'name': catalog.name,
-                'type': 'catalog',
-                'children': [],  # Empty array means children not fetched yet
-                'hasChildren': True  # Catalogs can always have schemas
-            } for catalog in catalogs]
+            # Catalogs can always have schemas
+            result = [CatalogNode(id=catalog.name, name=catalog.name, type='catalog', has_children=True)
+                      for catalog in catalogs]
 
             logger.debug(f"Successfully formatted {len(result)} catalogs")
             return result
@@ -45,30 +96,75 @@ class CatalogCommanderManager:
             logger.error(f"Error in list_catalogs: {e!s}", exc_info=True)
             raise
 
-    def list_schemas(self, catalog_name: str) -> List[Dict[str, Any]]:
+    @_ttl_cached('schemas')
+    def list_schemas(self, catalog_name: str) -> List[CatalogNode]:
         """List all schemas in a catalog.
         
         Args:
             catalog_name: Name of the catalog
             
         Returns:
-            List of schema information dictionaries
+            List of schema nodes
         """
         logger.debug(f"Fetching schemas for catalog: {catalog_name}")
         schemas = list(self.client.schemas.list(catalog_name=catalog_name))  # Convert generator to list
 
-        result = [{
-            'id': f"{catalog_name}.{schema.name}",
-            'name': schema.name,
-            'type': 'schema',
-            'children': [],  # Empty array means children not fetched yet
-            'hasChildren': True  # Schemas can always have tables
-        } for schema in schemas]
+        # Schemas can always have tables
+        result = [CatalogNode(id=f"{catalog_name}.{schema.name}", name=schema.name, type='schema', has_children=True)
+                  for schema in schemas]
 
         logger.debug(f"Successfully retrieved {len(result)} schemas for catalog {catalog_name}")
         return result
 
-    def list_tables(self, catalog_name: str, schema_name: str) -> List[Dict[str, Any]]:
+    @_ttl_cached('objects')
+    def _list_all_objects(self, catalog_name: str, schema_name: str) -> Tuple[List[CatalogNode], List[CatalogNode]]:
+        """Fetch every table and view in a schema through the Unity Catalog REST API.
+
+        Columns, properties and owner names are omitted server-side. Both the full
+        listing and the views-only listing are built in one pass, so list_tables
+        and list_views share one cached fetch.
+
+        Args:
+            catalog_name: Name of the catalog
+            schema_name: Name of the schema
+
+        Returns:
+            Tuple of (all table/view nodes, view nodes)
+        """
+        logger.debug(f"Fetching tables and views for schema: {catalog_name}.{schema_name}")
+        query = {
+            'catalog_name': catalog_name,
+            'schema_name': schema_name,
+            'max_results': TABLES_PAGE_SIZE,
+            'omit_columns': True,
+            'omit_properties': True,
+            'omit_username': True,
+        }
+        id_prefix = f"{catalog_name}.{schema_name}."
+        all_objects: List[CatalogNode] = []
+        views: List[CatalogNode] = []
+        while True:
+            page = self.client.api_client.do('GET', TABLES_API_PATH, query=query)
+            for table in page.get('tables', []):
+                name = table['name']
+                is_view = table.get('table_type') == 'VIEW'
+                # Tables/views are leaf nodes
+                node = CatalogNode(
+                    id=id_prefix + name,
+                    name=name,
+                    type='view' if is_view else 'table',
+                    has_children=False
+                )
+                all_objects.append(node)
+                if is_view:
+                    views.append(node)
+            next_page_token = page.get('next_page_token')
+            if not next_page_token:
+                break
+            query['page_token'] = next_page_token
+        return all_objects, views
+
+    def list_tables(self, catalog_name: str, schema_name: str) -> List[CatalogNode]:
         """List all tables and views in a schema.
         
         Args:
@@ -76,23 +172,13 @@ class CatalogCommanderManager:
             schema_name: Name of the schema
             
         Returns:
-            List of table/view information dictionaries
+            List of table/view nodes
         """
-        logger.debug(f"Fetching tables for schema: {catalog_name}.{schema_name}")
-        tables = list(self.client.tables.list(catalog_name=catalog_name, schema_name=schema_name))  # Convert generator to list
-
-        result = [{
-            'id': f"{catalog_name}.{schema_name}.{table.name}",
-            'name': table.name,
-            'type': 'view' if hasattr(table, 'table_type') and table.table_type == 'VIEW' else 'table',
-            'children': [],  # Empty array for consistency
-            'hasChildren': False  # Tables/views are leaf nodes
-        } for table in tables]
-
+        result = self._list_all_objects(catalog_name, schema_name)[0]
         logger.debug(f"Successfully retrieved {len(result)} tables for schema {catalog_name}.{schema_name}")
         return result
 
-    def list_views(self, catalog_name: str, schema_name: str) -> List[Dict[str, Any]]:
+    def list_views(self, catalog_name: str, schema_name: str) -> List[CatalogNode]:
         """List all views in a schema.
 
         Args:
@@ -100,29 +186,17 @@ class CatalogCommanderManager:
             schema_name: Name of the schema
 
         Returns:
-            List of view information dictionaries
+            List of view nodes
         """
-        logger.debug(f"Fetching views for schema: {catalog_name}.{schema_name}")
         try:
-            # Use tables.list and filter for views
-            all_tables = list(self.client.tables.list(catalog_name=catalog_name, schema_name=schema_name))
-            views = [tbl for tbl in all_tables if hasattr(tbl, 'table_type') and tbl.table_type == 'VIEW']
-
-            result = [{
-                'id': f"{catalog_name}.{schema_name}.{view.name}",
-                'name': view.name,
-                'type': 'view',
-                'children': [],
-                'hasChildren': False
-            } for view in views]
-
+            result = self._list_all_objects(catalog_name, schema_name)[1]
             logger.debug(f"Successfully retrieved {len(result)} views for schema {catalog_name}.{schema_name}")
             return result
         except Exception as e:
             logger.error(f"Error listing views for {catalog_name}.{schema_name}: {e!s}", exc_info=True)
             raise
 
-    def list_functions(self, catalog_name: str, schema_name: str) -> List[Dict[str, Any]]:
+    def list_functions(self, catalog_name: str, schema_name: str) -> List[CatalogNode]:
         """List all functions in a schema.
 
         Args:
@@ -130,19 +204,15 @@ class CatalogCommanderManager:
             schema_name: Name of the schema
 
         Returns:
-            List of function information dictionaries
+            List of function nodes
         """
         logger.info(f"Fetching functions for schema: {catalog_name}.{schema_name}")
         try:
             functions = list(self.client.functions.list(catalog_name=catalog_name, schema_name=schema_name))
 
-            result = [{
-                'id': function.full_name, # Functions usually have full_name
-                'name': function.name,
-                'type': 'function',
-                'children': [],
-                'hasChildren': False
-            } for function in functions]
+            # Functions usually have full_name
+            result = [CatalogNode(id=function.full_name, name=function.name, type='function', has_children=False)
+                      for function in functions]
 
             logger.info(f"Successfully retrieved {len(result)} functions for schema {catalog_name}.{schema_name}")
             return result
@@ -150,6 +220,48 @@ class CatalogCommanderManager:
             logger.error(f"Error listing functions for {catalog_name}.{schema_name}: {e!s}", exc_info=True)
             raise
 
+    async def list_catalogs_async(self) -> List[CatalogNode]:
+        """Async variant of list_catalogs that runs the blocking SDK call in a worker thread."""
+        return await asyncio.to_thread(self.list_catalogs)
+
+    async def list_schemas_async(self, catalog_name: str) -> List[CatalogNode]:
+        """Async variant of list_schemas that runs the blocking SDK call in a worker thread."""
+        return await asyncio.to_thread(self.list_schemas, catalog_name)
+
+    async def list_tables_async(self, catalog_name: str, schema_name: str) -> List[CatalogNode]:
+        """Async variant of list_tables that runs the blocking SDK call in a worker thread."""
+        return await asyncio.to_thread(self.list_tables, catalog_name, schema_name)
+
+    async def list_views_async(self, catalog_name: str, schema_name: str) -> List[CatalogNode]:
+        """Async variant of list_views that runs the blocking SDK call in a worker thread."""
+        return await asyncio.to_thread(self.list_views, catalog_name, schema_name)
+
+    async def list_functions_async(self, catalog_name: str, schema_name: str) -> List[CatalogNode]:
+        """Async variant of list_functions that runs the blocking SDK call in a worker thread."""
+        return await asyncio.to_thread(self.list_functions, catalog_name, schema_name)
+
+    async def list_all(self) -> List[Dict[str, Any]]:
+        """List all catalogs with their schemas fetched concurrently.
+
+        A failure to list the schemas of one catalog is logged and leaves that
+        catalog's children empty instead of failing the whole listing.
+
+        Returns:
+            List of catalog dictionaries with 'children' populated by schemas
+        """
+        catalogs = await self.list_catalogs_async()
+        results = await asyncio.gather(
+            *(self.list_schemas_async(catalog.name) for catalog in catalogs),
+            return_exceptions=True
+        )
+        result = []
+        for catalog, schemas in zip(catalogs, results):
+            if isinstance(schemas, BaseException):
+                logger.warning(f"Failed to list schemas for catalog {catalog.name}: {schemas!s}")
+                schemas = []
+            result.append({**catalog.to_dict(), 'children': [schema.to_dict() for schema in schemas]})
+        return result
+
     def get_dataset(self, dataset_path: str) -> Dict[str, Any]:
         """Get dataset schema and comprehensive UC metadata using the shared WorkspaceClient.
 
@@ -642,7 +642,6 @@ class DataContractsManager(SearchableAsset):
                             prop_dict['transformLogic'] = prop.transform_logic
                         if prop.transform_source_objects:
                             try:
-                                import json
                                 prop_dict['transformSourceObjects'] = json.loads(prop.transform_source_objects)
                             except (json.JSONDecodeError, TypeError):
                                 prop_dict['transformSourceObjects'] = prop.transform_source_objects
@@ -650,7 +649,6 @@ class DataContractsManager(SearchableAsset):
                             prop_dict['description'] = prop.transform_description
                         if prop.examples:
                             try:
-                                import json
                                 prop_dict['examples'] = json.loads(prop.examples)
                             except (json.JSONDecodeError, TypeError):
                                 prop_dict['examples'] = prop.examples
@@ -658,7 +656,6 @@ class DataContractsManager(SearchableAsset):
                             prop_dict['criticalDataElement'] = prop.critical_data_element
                         if prop.logical_type_options_json:
                             try:
-                                import json
                                 logical_type_options = json.loads(prop.logical_type_options_json)
                                 prop_dict.update(logical_type_options)  # Merge constraints into property
                             except (json.JSONDecodeError, TypeError):
@@ -736,7 +733,6 @@ class DataContractsManager(SearchableAsset):
                                 prop_value = custom_prop.value
                                 try:
                                     # Try to parse JSON if it's a serialized object
-                                    import json
                                     prop_value = json.loads(custom_prop.value)
                                 except (json.JSONDecodeError, TypeError):
                                     pass  # Keep as string
@@ -884,7 +880,6 @@ class DataContractsManager(SearchableAsset):
                         prop_value = custom_prop.value
                         try:
                             # Try to parse JSON if it's a serialized object
-                            import json
                             prop_value = json.loads(custom_prop.value)
                         except (json.JSONDecodeError, TypeError):
                             pass  # Keep as string
@@ -1008,7 +1003,6 @@ class DataContractsManager(SearchableAsset):
                 prop_value: Any = prop.value
                 if isinstance(prop_value, str):
                     try:
-                        import json
                         parsed = json.loads(prop_value)
                         prop_value = parsed
                     except (json.JSONDecodeError, TypeError):
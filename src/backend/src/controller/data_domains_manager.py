@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session, joinedload, selectinload # Added joinedload,
 from sqlalchemy.exc import IntegrityError # Import IntegrityError
 
 from src.repositories.data_domain_repository import DataDomainRepository
-from src.models.data_domains import DataDomainCreate, DataDomainUpdate, DataDomainRead, DataDomainBasicInfo # Added DataDomainBasicInfo
+from src.models.data_domains import DataDomainCreate, DataDomainUpdate, DataDomainRead, DataDomainBasicInfo, DATA_DOMAIN_BASIC_INFO_LIST_ADAPTER
 from src.db_models.data_domains import DataDomain
 from src.common.logging import get_logger
 from src.common.errors import ConflictError, NotFoundError, AppError # Import custom errors, AppError for validation
@@ -26,18 +26,16 @@ class DataDomainManager:
         logger.debug("DataDomainManager initialized.")
 
     def _convert_db_to_read_model(self, db_domain: DataDomain, db: Optional[Session] = None) -> DataDomainRead:
-        """Helper to convert DB model to Read model, populating parent_name and children_count."""
+        """Helper to convert DB model to Read model, populating parent_name and children_info."""
         parent_name = None
         parent_info_data: Optional[DataDomainBasicInfo] = None
         if db_domain.parent: # Assuming parent is loaded
             parent_name = db_domain.parent.name
             parent_info_data = DataDomainBasicInfo.model_validate(db_domain.parent) # Use model_validate for Pydantic v2
 
-        children_count = len(db_domain.children) # Assuming children are loaded or counted
         children_info_data: List[DataDomainBasicInfo] = []
         if db_domain.children:
-            for child_db_obj in db_domain.children:
-                children_info_data.append(DataDomainBasicInfo.model_validate(child_db_obj))
+            children_info_data = DATA_DOMAIN_BASIC_INFO_LIST_ADAPTER.validate_python(db_domain.children, from_attributes=True)
 
         # Load tags from TagsManager
         tags_list = []
@@ -61,7 +59,6 @@ class DataDomainManager:
             updated_at=db_domain.updated_at,
             created_by=db_domain.created_by,
             parent_name=parent_name,
-            children_count=children_count,
             parent_info=parent_info_data,
             children_info=children_info_data
         )
@@ -1,8 +1,9 @@
 import asyncio
+import hashlib
 import logging
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 
 import yaml
 from pydantic import ValidationError, parse_obj_as, BaseModel
@@ -14,6 +15,7 @@ from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import NotFound, PermissionDenied
 
 from src.models.data_products import (
+    DATA_PRODUCT_LIST_ADAPTER,
     DataOutput,
     DataProduct as DataProductApi,
     DataProductCreate,
@@ -89,30 +91,29 @@ class DataProductsManager(SearchableAsset):
         """Validates input data and creates a new data product via the repository."""
         logger.debug(f"Manager attempting to create product from data: {product_data}")
         try:
-            # Validate the input dict into a Pydantic model first
-            try:
-                # Ensure ID exists before validation if needed
-                if not product_data.get('id'):
-                     product_data['id'] = str(uuid.uuid4())
-                     logger.info(f"Generated ID {product_data['id']} during create_product validation.")
-                
-                # Ensure timestamps are set if missing from input data
-                now = datetime.utcnow()
-                product_data.setdefault('created_at', now)
-                product_data.setdefault('updated_at', now)
-                
-                # Validate
-                product_api_model = DataProductApi(**product_data)
-                
-            except ValidationError as e:
-                 logger.error(f"Validation failed converting dict to DataProductApi model: {e}")
-                 # Raise a specific error or handle as needed
-                 raise ValueError(f"Invalid data provided for product creation: {e}") from e
+            # Ensure ID exists before validation if needed
+            if not product_data.get('id'):
+                 product_data['id'] = str(uuid.uuid4())
+                 logger.info(f"Generated ID {product_data['id']} during create_product validation.")
+
+            # Ensure timestamps are set if missing from input data
+            now = datetime.utcnow()
+            product_data.setdefault('created_at', now)
+            product_data.setdefault('updated_at', now)
+
+            product_api_model = DataProductApi(**product_data)
+        except ValidationError as e:
+            logger.error(f"Validation failed converting dict to DataProductApi model: {e}")
+            raise ValueError(f"Invalid data provided for product creation: {e}") from e
+
+        return self.create_product_from_model(product_api_model)
 
-            # Extract tags before creating the product (tags are handled separately)
-            tags_data = product_data.get('tags', [])
+    def create_product_from_model(self, product_api_model: DataProductApi) -> DataProductApi:
+        """Creates a new data product from an already validated model without re-validating it."""
+        try:
+            # Tags are handled separately from the product row
+            tags_data = [tag.model_dump(mode='json') for tag in product_api_model.tags or []]
 
-            # Now pass the validated Pydantic model to the repository
             # The repository's create method expects the Pydantic model (DataProductCreate alias)
             created_db_obj = self._repo.create(db=self._db, obj_in=product_api_model)
 
@@ -130,7 +131,7 @@ class DataProductsManager(SearchableAsset):
         except SQLAlchemyError as e:
             logger.error(f"Database error creating data product: {e}")
             raise
-        except ValueError as e: # Catch validation errors from above or repo mapping
+        except ValueError as e: # Catch validation errors from repo mapping
             logger.error(f"Value error during product creation: {e}")
             raise # Re-raise ValueError
         except ValidationError as e:
@@ -154,16 +155,35 @@ class DataProductsManager(SearchableAsset):
             logger.error(f"Unexpected error getting product {product_id}: {e}")
             raise
 
+    def get_product_etag(self, product_id: str) -> Optional[str]:
+        """Return an HTTP ETag for the product's current representation, or None if it does not exist."""
+        try:
+            marker = self._repo.get_change_marker(db=self._db, id=product_id)
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting change marker for product {product_id}: {e}")
+            raise
+        if marker is None:
+            return None
+        digest = hashlib.md5(repr(tuple(marker)).encode(), usedforsecurity=False).hexdigest()
+        return f'"{digest}"'
+
+    def get_existing_product_ids(self, product_ids: List[str]) -> Set[str]:
+        """Return which of the given product IDs already exist, using one query."""
+        try:
+            return self._repo.get_existing_ids(db=self._db, ids=product_ids)
+        except SQLAlchemyError as e:
+            logger.error(f"Database error checking existing product ids: {e}")
+            raise
+
     def list_products(self, skip: int = 0, limit: int = 100) -> List[DataProductApi]:
         """List data products using the repository."""
         try:
             products_db = self._repo.get_multi(db=self._db, skip=skip, limit=limit)
-            # Load each product with its tags
-            products_with_tags = []
-            for product_db in products_db:
-                product_with_tags = self._load_product_with_tags(product_db)
-                products_with_tags.append(product_with_tags)
-            return products_with_tags
+            # Map all rows to API models in one pass, then attach each product's tags
+            products = DATA_PRODUCT_LIST_ADAPTER.validate_python(products_db, from_attributes=True)
+            for product_api in products:
+                self._attach_tags(product_api)
+            return products
         except SQLAlchemyError as e:
             logger.error(f"Database error listing products: {e}")
             raise
@@ -620,26 +640,26 @@ class DataProductsManager(SearchableAsset):
         logger.info("Fetching data products for search indexing...")
         items = []
         try:
-            # Fetch all products (adjust limit if needed, but potentially large)
-            # Consider fetching only necessary fields if performance becomes an issue
-            products_api = self.list_products(limit=10000) # Fetch Pydantic models
-            
-            for product in products_api:
-                if not product.id or not product.info or not product.info.title:
-                     logger.warning(f"Skipping product due to missing id or info.title: {product}")
+            # Only the indexed columns are selected; ports and full API models are not needed here
+            rows = self._repo.get_search_rows(db=self._db, limit=10000)
+            tags_by_product = self._get_tags_by_product([row.id for row in rows])
+
+            for row in rows:
+                if not row.title:
+                     logger.warning(f"Skipping product {row.id} due to missing info.title")
                      continue
-                     
+
                 items.append(
                     SearchIndexItem(
-                        id=f"product::{product.id}",
-                        version=product.version, # Add version
-                        product_type=product.productType if product.productType else None, 
+                        id=f"product::{row.id}",
+                        version=row.version, # Add version
+                        product_type=row.product_type or None,
                         type="data-product", # Keep type for frontend icon/rendering
                         feature_id="data-products", # <-- Add this
-                        title=product.info.title,
-                        description=product.info.description or "",
-                        link=f"/data-products/{product.id}",
-                        tags=product.tags or []
+                        title=row.title,
+                        description=row.description or "",
+                        link=f"/data-products/{row.id}",
+                        tags=[tag.fully_qualified_name for tag in tags_by_product.get(row.id, [])]
                         # Add other fields like owner, status, domain if desired
                         # owner=product.info.owner,
                         # status=product.info.status,
@@ -706,24 +726,7 @@ class DataProductsManager(SearchableAsset):
         try:
             # Convert DB object to API model
             product_api = DataProductApi.from_orm(db_obj)
-
-            # Load associated tags if tags_manager is available
-            if self._tags_manager:
-                try:
-                    assigned_tags = self._entity_tag_repo.get_assigned_tags(
-                        db=self._db,
-                        entity_id=db_obj.id,
-                        entity_type="data_product"
-                    )
-                    # Convert to the expected format
-                    product_api.tags = assigned_tags
-                except Exception as e:
-                    logger.error(f"Failed to load tags for product {db_obj.id}: {e}")
-                    # Set empty tags list on error
-                    product_api.tags = []
-            else:
-                product_api.tags = []
-
+            self._attach_tags(product_api)
             return product_api
 
         except Exception as e:
@@ -731,6 +734,39 @@ class DataProductsManager(SearchableAsset):
             # Fallback to basic conversion
             return DataProductApi.from_orm(db_obj)
 
+    def _attach_tags(self, product_api: DataProductApi) -> None:
+        """Sets the product's assigned tags in place (empty if tags are unavailable)."""
+        product_api.tags = self._get_product_tags(product_api.id)
+
+    def _get_product_tags(self, product_id: str) -> List[Any]:
+        """Returns the product's assigned tags, or an empty list if tags are unavailable."""
+        # Load associated tags if tags_manager is available
+        if not self._tags_manager:
+            return []
+        try:
+            return self._entity_tag_repo.get_assigned_tags(
+                db=self._db,
+                entity_id=product_id,
+                entity_type="data_product"
+            )
+        except Exception as e:
+            logger.error(f"Failed to load tags for product {product_id}: {e}")
+            return []
+
+    def _get_tags_by_product(self, product_ids: List[str]) -> Dict[str, List[Any]]:
+        """Returns the assigned tags of many products in one query, keyed by product id."""
+        if not self._tags_manager:
+            return {}
+        try:
+            return self._entity_tag_repo.get_assigned_tags_for_entities(
+                db=self._db,
+                entity_ids=product_ids,
+                entity_type="data_product"
+            )
+        except Exception as e:
+            logger.error(f"Failed to load tags for {len(product_ids)} products: {e}")
+            return {}
+
     def assign_tag_to_product(self, product_id: str, tag_id: str, assigned_value: Optional[str] = None, assigned_by: str = "system") -> bool:
         """Public method to assign a tag to a data product."""
         if not self._tags_manager:
@@ -1,6 +1,8 @@
 from __future__ import annotations # Ensure forward references work
 import logging
-from typing import Any, Dict, List, Optional, Iterable, TYPE_CHECKING
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Iterable, Tuple, TYPE_CHECKING
 
 # Import Search Interfaces
 from src.common.search_interfaces import SearchableAsset, SearchIndexItem
@@ -24,6 +26,8 @@ class SearchManager:
         """Initialize search manager with a collection of pre-instantiated searchable asset managers."""
         self.searchable_managers = list(searchable_managers)
         self.index: List[SearchIndexItem] = []
+        # Sorted (lowercased field value, index position) pairs for prefix lookups
+        self._sorted_keys: List[Tuple[str, int]] = []
         
         logger.info(f"SearchManager initialized with {len(self.searchable_managers)} managers.")
         
@@ -34,23 +38,50 @@ class SearchManager:
         logger.info(f"Building search index from {len(self.searchable_managers)} managers...")
         new_index: List[SearchIndexItem] = [] # Build into a new list
 
+        # Managers sharing a SQLAlchemy session must not use it from two threads,
+        # so they are fetched sequentially within one worker; the rest fan out.
+        groups: Dict[int, List[SearchableAsset]] = {}
+        for manager in self.searchable_managers:
+            session = getattr(manager, '_db', None)
+            groups.setdefault(id(session) if session is not None else id(manager), []).append(manager)
+
+        items_by_manager: Dict[int, List[SearchIndexItem]] = {}
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(16, len(groups))) as executor:
+                for fetched in executor.map(self._fetch_items, groups.values()):
+                    items_by_manager.update(fetched)
+
+        # Assemble in manager order so the index is deterministic
         for manager in self.searchable_managers:
             manager_name = manager.__class__.__name__
-            try:
-                # Ensure managers populate the new feature_id field
-                items = manager.get_search_index_items()
-                for item in items:
-                    if not hasattr(item, 'feature_id') or not item.feature_id:
-                         logger.warning(f"Search item {item.id} from {manager_name} is missing feature_id. Skipping.")
-                         continue
-                    new_index.append(item)
-            except Exception as e:
-                logger.error(f"Failed to get search items from {manager_name}: {e}", exc_info=True)
-        
+            for item in items_by_manager.get(id(manager), []):
+                if not hasattr(item, 'feature_id') or not item.feature_id:
+                     logger.warning(f"Search item {item.id} from {manager_name} is missing feature_id. Skipping.")
+                     continue
+                new_index.append(item)
+
+        # Lowercase each searchable field once here instead of on every query
+        sorted_keys: List[Tuple[str, int]] = []
+        for position, item in enumerate(new_index):
+            fields = [item.title, item.description, *(str(tag) for tag in item.tags or [])]
+            sorted_keys.extend((field.lower(), position) for field in fields if field)
+        sorted_keys.sort()
+
         # Atomically replace the index
-        self.index = new_index
+        self.index, self._sorted_keys = new_index, sorted_keys
         logger.info(f"Search index build complete. Total items: {len(self.index)}")
 
+    @staticmethod
+    def _fetch_items(managers: List[SearchableAsset]) -> Dict[int, List[SearchIndexItem]]:
+        """Fetches search items from each manager in turn, keyed by manager id."""
+        fetched: Dict[int, List[SearchIndexItem]] = {}
+        for manager in managers:
+            try:
+                fetched[id(manager)] = list(manager.get_search_index_items())
+            except Exception as e:
+                logger.error(f"Failed to get search items from {manager.__class__.__name__}: {e}", exc_info=True)
+        return fetched
+
     def search(self, query: str, auth_manager: AuthorizationManager, user: UserInfo) -> List[SearchIndexItem]:
         """
         Performs a case-insensitive prefix search on title, description, tags,
@@ -60,24 +91,14 @@ class SearchManager:
             return []
 
         query_lower = query.lower()
-        potential_results = []
-        for item in self.index:
-            match = False
-            # Check title
-            if item.title and item.title.lower().startswith(query_lower):
-                 match = True
-            # Check description (if not already matched)
-            elif item.description and item.description.lower().startswith(query_lower):
-                 match = True
-            # Check tags (if not already matched)
-            elif item.tags:
-                for tag in item.tags:
-                     if str(tag).lower().startswith(query_lower):
-                         match = True
-                         break # Found a matching tag
-            
-            if match:
-                potential_results.append(item)
+        index, sorted_keys = self.index, self._sorted_keys
+        matched_positions = set()
+        # All keys sharing the prefix sit in one contiguous run of the sorted list
+        i = bisect_left(sorted_keys, (query_lower, -1))
+        while i < len(sorted_keys) and sorted_keys[i][0].startswith(query_lower):
+            matched_positions.add(sorted_keys[i][1])
+            i += 1
+        potential_results = [index[position] for position in sorted(matched_positions)]
 
         # Filter based on permissions using AuthorizationManager
         if not user.groups:
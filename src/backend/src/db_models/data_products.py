@@ -1,10 +1,29 @@
-from sqlalchemy import Column, String, DateTime, Text, Boolean, func, ForeignKey, Table, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, Text, Boolean, JSON, DDL, FetchedValue, event, inspect, text, ForeignKey, Index, Table, UniqueConstraint
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID # Generic UUID type
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.dialects.postgresql import JSONB, UUID # Generic UUID type
 import uuid
-import json # For links/custom
 
 from src.common.database import Base
+from src.common.ids import uuid7
+
+# JSONB on PostgreSQL (decoded by the driver, queryable server-side); plain JSON elsewhere (e.g. SQLite tests)
+JSONDocument = JSON().with_variant(JSONB(), 'postgresql')
+
+
+class statement_timestamp(FunctionElement):
+    """Server time of the current statement (now() would repeat the transaction start time)."""
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+@compiles(statement_timestamp, 'postgresql')
+def _statement_timestamp_postgresql(element, compiler, **kw):
+    return 'statement_timestamp()'
+
+@compiles(statement_timestamp)
+def _statement_timestamp_default(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
 
 # --- Association Table for Many-to-Many Tags ---
 # data_product_tag_association = Table(
@@ -32,8 +51,9 @@ class DataProductDb(Base):
     # Core Fields
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     dataProductSpecification = Column(String, nullable=False, default="0.0.1")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=statement_timestamp(), nullable=False)
+    # Maintained by the BEFORE UPDATE trigger below on PostgreSQL, so bulk/Core updates bump it too
+    updated_at = Column(DateTime(timezone=True), server_default=statement_timestamp(), server_onupdate=FetchedValue(), nullable=False)
     version = Column(String, nullable=False, default="1.0.0", index=True)
     product_type = Column(String, nullable=True, index=True)
 
@@ -41,77 +61,114 @@ class DataProductDb(Base):
     project_id = Column(String, ForeignKey('projects.id'), nullable=True, index=True)
 
     # Relationships (Corrected names)
-    info = relationship("InfoDb", back_populates="data_product", uselist=False, cascade="all, delete-orphan")
-    inputPorts = relationship("InputPortDb", back_populates="data_product", cascade="all, delete-orphan", lazy="selectin")
-    outputPorts = relationship("OutputPortDb", back_populates="data_product", cascade="all, delete-orphan", lazy="selectin")
+    # Never loaded implicitly: query sites opt in with loader options so header-only reads stay one query
+    info = relationship("InfoDb", back_populates="data_product", uselist=False, cascade="all, delete-orphan", lazy="raise_on_sql")
+    inputPorts = relationship("InputPortDb", back_populates="data_product", cascade="all, delete-orphan", lazy="raise_on_sql")
+    outputPorts = relationship("OutputPortDb", back_populates="data_product", cascade="all, delete-orphan", lazy="raise_on_sql")
     # tags = relationship("Tag", secondary=data_product_tag_association, backref="data_products", lazy="selectin") # REMOVED relationship to old Tag model
 
-    # Kept as JSON Strings
-    links = Column(String, nullable=True, default='{}')
-    custom = Column(String, nullable=True, default='{}')
+    links = Column(JSONDocument, nullable=True, default=dict, server_default='{}')
+    custom = Column(JSONDocument, nullable=True, default=dict, server_default='{}')
 
     def __repr__(self):
-        title = self.info.title if self.info else 'N/A'
-        return f"<DataProductDb(id='{self.id}', title='{title}')>"
+        # In-memory state only: repr (logs, debuggers) must never load expired columns or info
+        state = inspect(self)
+        product_id = state.identity[0] if state.identity else state.dict.get('id')
+        return f"<DataProductDb(id='{product_id}')>"
+
+# Tables created via create_all() get the updated_at trigger too (the migration covers existing ones)
+event.listen(DataProductDb.__table__, 'after_create', DDL("""
+CREATE OR REPLACE FUNCTION data_products_set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = statement_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""").execute_if(dialect='postgresql'))
+event.listen(DataProductDb.__table__, 'after_create', DDL(
+    "CREATE TRIGGER trg_data_products_updated_at BEFORE UPDATE ON data_products "
+    "FOR EACH ROW EXECUTE FUNCTION data_products_set_updated_at()"
+).execute_if(dialect='postgresql'))
 
 # --- Info Table (Restore index=True) ---
 class InfoDb(Base):
     __tablename__ = 'data_product_info'
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Surrogate key (never exposed): native 16-byte UUID, time-ordered for append-only inserts
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     data_product_id = Column(String, ForeignKey('data_products.id'), unique=True, nullable=False)
     
     title = Column(String, nullable=False)
-    owner_team_id = Column(String, ForeignKey('teams.id'), nullable=True, index=True)  # Team UUID reference
-    domain = Column(String, nullable=True, index=True)
+    owner_team_id = Column(String, ForeignKey('teams.id'), nullable=True)  # Team UUID reference
+    domain = Column(String, nullable=True)
     description = Column(Text, nullable=True)
-    status = Column(String, nullable=True, index=True)
+    status = Column(String, nullable=True) # Partial index in __table_args__
     archetype = Column(String, nullable=True, index=True)
     
     # Relationships
     owner_team = relationship("TeamDb", foreign_keys=[owner_team_id])
     data_product = relationship("DataProductDb", back_populates="info")
 
+    # Composite indexes for domain/team listings filtered by status; the leading
+    # columns also serve single-column lookups on domain and owner_team_id
+    __table_args__ = (
+        Index('ix_data_product_info_domain_status', 'domain', 'status', postgresql_include=['data_product_id']),
+        Index('ix_data_product_info_team_status', 'owner_team_id', 'status'),
+        # Serves get_distinct_statuses (status IS NOT NULL); products without a status are left out of the index
+        Index('ix_data_product_info_status', 'status', postgresql_where=text('status IS NOT NULL')),
+    )
+
 # --- InputPort Table (Corrected relationship) ---
 class InputPortDb(Base):
     __tablename__ = 'input_ports'
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    data_product_id = Column(String, ForeignKey('data_products.id'), nullable=False)
+    data_product_id = Column(String, ForeignKey('data_products.id'), nullable=False, index=True) # Used by selectin loads of ports
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     port_type = Column('type', String, nullable=True) # Renamed to avoid keyword conflict
-    asset_type = Column(String, nullable=True, index=True) # New: Asset Type
-    asset_identifier = Column(String, nullable=True, index=True) # New: Asset Identifier
+    asset_type = Column(String, nullable=True) # New: Asset Type
+    asset_identifier = Column(String, nullable=True) # New: Asset Identifier
     location = Column(String, nullable=True)
     
     sourceSystemId = Column(String, nullable=False)
     sourceOutputPortId = Column(String, nullable=True) # Nullable for external sources or if link not specified
-    links = Column(String, nullable=True, default='{}') # JSON String
-    custom = Column(String, nullable=True, default='{}') # JSON String
+    links = Column(JSONDocument, nullable=True, default=dict, server_default='{}')
+    custom = Column(JSONDocument, nullable=True, default=dict, server_default='{}')
     # tags: Moved to EntityTagAssociationDb for rich tag support
     
     # Relationship back to DataProductDb (Corrected reference)
     data_product = relationship("DataProductDb", back_populates="inputPorts")
+
+    # Asset lookups (by identifier, optionally narrowed by type) resolve to the owning product index-only
+    __table_args__ = (
+        Index('ix_input_ports_asset', 'asset_identifier', 'asset_type', postgresql_include=['data_product_id']),
+    )
     
 # --- OutputPort Table (Restore index=True) ---
 class OutputPortDb(Base):
     __tablename__ = 'output_ports'
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    data_product_id = Column(String, ForeignKey('data_products.id'), nullable=False)
+    data_product_id = Column(String, ForeignKey('data_products.id'), nullable=False, index=True) # Used by selectin loads of ports
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     port_type = Column('type', String, nullable=True) # Renamed to avoid keyword conflict
-    asset_type = Column(String, nullable=True, index=True) # New: Asset Type
-    asset_identifier = Column(String, nullable=True, index=True) # New: Asset Identifier
+    asset_type = Column(String, nullable=True) # New: Asset Type
+    asset_identifier = Column(String, nullable=True) # New: Asset Identifier
     location = Column(String, nullable=True)
     
-    status = Column(String, nullable=True, index=True)
-    server = Column(String, nullable=True, default='{}') # JSON String
+    status = Column(String, nullable=True) # Partial index in __table_args__
+    server = Column(JSONDocument, nullable=True, default=dict, server_default='{}')
     containsPii = Column(Boolean, default=False)
     autoApprove = Column(Boolean, default=False)
     dataContractId = Column(String, nullable=True)
-    links = Column(String, nullable=True, default='{}') # JSON String
-    custom = Column(String, nullable=True, default='{}') # JSON String
+    links = Column(JSONDocument, nullable=True, default=dict, server_default='{}')
+    custom = Column(JSONDocument, nullable=True, default=dict, server_default='{}')
     # tags: Moved to EntityTagAssociationDb for rich tag support
     
     # Relationship back to DataProductDb (Corrected reference)
-    data_product = relationship("DataProductDb", back_populates="outputPorts") 
\ No newline at end of file
+    data_product = relationship("DataProductDb", back_populates="outputPorts")
+
+    # Same asset lookup index as input_ports
+    __table_args__ = (
+        Index('ix_output_ports_asset', 'asset_identifier', 'asset_type', postgresql_include=['data_product_id']),
+        Index('ix_output_ports_status', 'status', postgresql_where=text('status IS NOT NULL')),
+    ) 
\ No newline at end of file
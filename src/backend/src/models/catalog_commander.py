@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -27,3 +28,27 @@ class CatalogOperation(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     metadata: Dict[str, Any] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class CatalogNode:
+    """Compact tree node for catalog/schema/table/view/function listings.
+
+    Listings are cached and can hold thousands of entries, so nodes are slotted
+    rather than plain dicts; the always-empty ``children`` list is added only
+    when a node is serialized.
+    """
+    id: str
+    name: str
+    type: str
+    has_children: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON shape the catalog tree UI expects."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'type': self.type,
+            'children': [],  # Empty array means children not fetched yet
+            'hasChildren': self.has_children,
+        }
@@ -4,7 +4,7 @@ from typing import List, Optional, Dict, Any, Union
 import json
 import logging # Import logging
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator, computed_field
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, field_validator, computed_field
 
 from .tags import AssignedTag, AssignedTagCreate
 
@@ -134,7 +134,7 @@ class OutputPort(Port):
     autoApprove: bool = Field(False, description="Automatically approve requested data usage agreements")
     dataContractId: Optional[str] = Field(None, description="Technical identifier of the data contract", example="search-queries-all")
 
-    # Validator for the 'server' field stored as JSON string in OutputPortDb
+    # Validator for 'server' values still held as JSON text (rows written before the JSONB columns)
     _parse_server_json = field_validator('server', mode='before')(parse_json_if_string)
 
     model_config = {
@@ -157,7 +157,7 @@ class DataProduct(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    # Validator for fields stored as JSON string in DataProductDb
+    # Validator for values still held as JSON text (rows written before the JSONB columns)
     _parse_root_json_fields = field_validator('links', 'custom', mode='before')(parse_json_if_string)
 
     # Rich tags are now handled through AssignedTag objects
@@ -168,6 +168,9 @@ class DataProduct(BaseModel):
         "from_attributes": True
     }
 
+# Built once: validates or serializes a whole list of products (ORM rows or dicts) in one pydantic-core call
+DATA_PRODUCT_LIST_ADAPTER = TypeAdapter(List[DataProduct])
+
 
 # --- Request Models ---
 
@@ -1,12 +1,12 @@
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import select, Column, distinct
-from typing import List, Optional, Any, Dict, Union
-import json # Needed for parsing JSON strings
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
+from sqlalchemy import select, Column, distinct, func
+from typing import List, Optional, Any, Dict, Set, Union
 
 from src.common.repository import CRUDBase
 from src.models.data_products import DataProduct as DataProductApi, Info, InputPort, OutputPort # Pydantic models
 # Import all relevant DB models
-from src.db_models.data_products import (DataProductDb, InfoDb, InputPortDb, OutputPortDb)
+from src.db_models.data_products import (DataProductDb, InfoDb, InputPortDb, OutputPortDb, statement_timestamp)
+from src.db_models.tags import EntityTagAssociationDb, TagDb
 from src.common.logging import get_logger
 
 logger = get_logger(__name__)
@@ -32,8 +32,8 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
         db_obj = self.model(
             id=obj_in.id,
             dataProductSpecification=obj_in.dataProductSpecification,
-            links=json.dumps(obj_in.links) if obj_in.links is not None else '{}',
-            custom=json.dumps(obj_in.custom) if obj_in.custom is not None else '{}',
+            links=obj_in.links if obj_in.links is not None else {},
+            custom=obj_in.custom if obj_in.custom is not None else {},
             version=obj_in.version, # Assume validated model has it
             # Handle productType being either enum or string after validation
             product_type=obj_in.productType.value if hasattr(obj_in.productType, 'value') else obj_in.productType
@@ -60,9 +60,9 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
                 port_data['asset_type'] = port_in.assetType
                 port_data['asset_identifier'] = port_in.assetIdentifier
 
-                # Ensure JSON fields are strings
-                port_data['links'] = json.dumps(port_data.get('links')) if port_data.get('links') else '{}'
-                port_data['custom'] = json.dumps(port_data.get('custom')) if port_data.get('custom') else '{}'
+                # JSON columns take the dicts as-is
+                port_data['links'] = port_data.get('links') or {}
+                port_data['custom'] = port_data.get('custom') or {}
 
                 # sourceOutputPortId is already correctly named from Pydantic model
 
@@ -81,9 +81,9 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
                 port_data['asset_type'] = port_in.assetType
                 port_data['asset_identifier'] = port_in.assetIdentifier
 
-                port_data['server'] = json.dumps(port_data.get('server')) if port_data.get('server') else '{}'
-                port_data['links'] = json.dumps(port_data.get('links')) if port_data.get('links') else '{}'
-                port_data['custom'] = json.dumps(port_data.get('custom')) if port_data.get('custom') else '{}'
+                port_data['server'] = port_data.get('server') or {}
+                port_data['links'] = port_data.get('links') or {}
+                port_data['custom'] = port_data.get('custom') or {}
                 port_obj = OutputPortDb(**port_data)
                 db_obj.outputPorts.append(port_obj)
             
@@ -92,8 +92,9 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
 
         try:
             db.add(db_obj) # Adding parent cascades adds related objects
-            db.flush() 
-            db.refresh(db_obj) # Refresh to get IDs and load relationships if needed
+            db.flush()
+            # No refresh: it would expire the info/port collections built above (which are never
+            # lazy loaded); server-side timestamps load on first access instead
             logger.info(f"Successfully created DataProduct (DB - norm) with id: {db_obj.id}")
             return db_obj
         except Exception as e:
@@ -111,10 +112,12 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
             update_data = obj_in
 
         try:
+            # Always bump updated_at (info/port-only edits leave the product row itself unchanged)
+            db_obj.updated_at = statement_timestamp()
             # Update core DataProduct fields
             db_obj.dataProductSpecification = update_data.get('dataProductSpecification', db_obj.dataProductSpecification)
-            if 'links' in update_data: db_obj.links = json.dumps(update_data['links'])
-            if 'custom' in update_data: db_obj.custom = json.dumps(update_data['custom'])
+            if 'links' in update_data: db_obj.links = update_data['links']
+            if 'custom' in update_data: db_obj.custom = update_data['custom']
             # Update new fields
             db_obj.version = update_data.get('version', db_obj.version)
             if 'productType' in update_data: # Check for Pydantic field name
@@ -154,10 +157,9 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
                      port_data.pop('assetType', None)
                      port_data.pop('assetIdentifier', None)
 
-                     # Stringify JSON fields
-                     port_data['links'] = json.dumps(port_data.get('links')) if port_data.get('links') else '{}'
-                     port_data['custom'] = json.dumps(port_data.get('custom')) if port_data.get('custom') else '{}'
-                     port_data['tags'] = json.dumps(port_data.get('tags')) if port_data.get('tags') else '[]'
+                     port_data['links'] = port_data.get('links') or {}
+                     port_data['custom'] = port_data.get('custom') or {}
+                     port_data.pop('tags', None) # Port tags live in EntityTagAssociationDb, not on the port row
                      # sourceOutputPortId is already correct in port_in_dict
                      port_obj = InputPortDb(**port_data)
                      db_obj.inputPorts.append(port_obj)
@@ -177,11 +179,10 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
                      port_data.pop('assetType', None)
                      port_data.pop('assetIdentifier', None)
 
-                     # Stringify JSON fields
-                     port_data['server'] = json.dumps(port_data.get('server')) if port_data.get('server') else '{}'
-                     port_data['links'] = json.dumps(port_data.get('links')) if port_data.get('links') else '{}'
-                     port_data['custom'] = json.dumps(port_data.get('custom')) if port_data.get('custom') else '{}'
-                     port_data['tags'] = json.dumps(port_data.get('tags')) if port_data.get('tags') else '[]'
+                     port_data['server'] = port_data.get('server') or {}
+                     port_data['links'] = port_data.get('links') or {}
+                     port_data['custom'] = port_data.get('custom') or {}
+                     port_data.pop('tags', None)
                      port_obj = OutputPortDb(**port_data)
                      db_obj.outputPorts.append(port_obj)
 
@@ -202,11 +203,12 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
     def get(self, db: Session, id: Any) -> Optional[DataProductDb]:
         logger.debug(f"Fetching DataProduct (DB - norm) with id: {id}")
         try:
-            # Use options to eagerly load relationships using selectinload (efficient)
+            # One-to-one info rides along on the product row; the port collections are batched with selectinload
             return db.query(self.model).options(
-                selectinload(self.model.info),
+                joinedload(self.model.info),
                 selectinload(self.model.inputPorts),
                 selectinload(self.model.outputPorts),
+                raiseload('*'), # Anything not loaded above must fail loudly instead of lazy loading per row
                 # selectinload(self.model.tags) # Tags are loaded via DataProductManager now
             ).filter(self.model.id == id).first()
         except Exception as e:
@@ -220,9 +222,10 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
         logger.debug(f"Fetching multiple DataProducts (DB - norm) with skip: {skip}, limit: {limit}")
         try:
             return db.query(self.model).options(
-                 selectinload(self.model.info),
+                 joinedload(self.model.info),
                  selectinload(self.model.inputPorts),
                  selectinload(self.model.outputPorts),
+                 raiseload('*'),
                  # selectinload(self.model.tags) # Tags are loaded via DataProductManager now
             ).offset(skip).limit(limit).all()
         except Exception as e:
@@ -230,6 +233,56 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
             db.rollback()
             raise
             
+    def get_existing_ids(self, db: Session, ids: List[Any]) -> Set[Any]:
+        """Return the subset of the given IDs that already exist, in a single query."""
+        if not ids:
+            return set()
+        try:
+            return set(db.execute(select(self.model.id).where(self.model.id.in_(ids))).scalars().all())
+        except Exception as e:
+            logger.error(f"Database error checking existing DataProduct ids: {e}", exc_info=True)
+            db.rollback()
+            raise
+
+    def get_change_marker(self, db: Session, id: Any) -> Optional[Any]:
+        """Return a row that changes whenever the product's API representation does, or None if not found.
+
+        Combines the product's updated_at with its tag assignments (count, latest assignment,
+        latest tag change), since tags live outside the data_products row. One indexed query.
+        """
+        try:
+            assignment = (EntityTagAssociationDb.entity_id == id) & (EntityTagAssociationDb.entity_type == "data_product")
+            stmt = select(
+                self.model.updated_at,
+                select(func.count(EntityTagAssociationDb.id)).where(assignment).scalar_subquery(),
+                select(func.max(EntityTagAssociationDb.assigned_at)).where(assignment).scalar_subquery(),
+                select(func.max(TagDb.updated_at))
+                    .join(EntityTagAssociationDb, EntityTagAssociationDb.tag_id == TagDb.id)
+                    .where(assignment).scalar_subquery(),
+            ).where(self.model.id == id)
+            return db.execute(stmt).first()
+        except Exception as e:
+            logger.error(f"Database error fetching change marker for DataProduct {id}: {e}", exc_info=True)
+            db.rollback()
+            raise
+
+    def get_search_rows(self, db: Session, *, limit: int = 10000) -> List[Any]:
+        """Return (id, version, product_type, title, description) rows for products with info.
+
+        A plain column select: no ORM objects, relationships or ports are built for the search index.
+        """
+        try:
+            stmt = (
+                select(self.model.id, self.model.version, self.model.product_type, InfoDb.title, InfoDb.description)
+                .join(InfoDb, InfoDb.data_product_id == self.model.id)
+                .limit(limit)
+            )
+            return db.execute(stmt).all()
+        except Exception as e:
+            logger.error(f"Database error fetching DataProduct search rows: {e}", exc_info=True)
+            db.rollback()
+            raise
+
     # --- Distinct Value Queries (Update for Normalized Schema) --- 
     def get_distinct_product_types(self, db: Session) -> List[str]:
         logger.debug("Querying distinct product_types from DB (normalized)...")
@@ -273,9 +326,10 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
         logger.debug(f"Fetching DataProducts for project {project_id} with skip: {skip}, limit: {limit}")
         try:
             return db.query(self.model).options(
-                selectinload(self.model.info),
+                joinedload(self.model.info),
                 selectinload(self.model.inputPorts),
                 selectinload(self.model.outputPorts),
+                raiseload('*'),
             ).filter(self.model.project_id == project_id).offset(skip).limit(limit).all()
         except Exception as e:
             logger.error(f"Database error fetching DataProducts by project {project_id}: {e}", exc_info=True)
@@ -287,9 +341,10 @@ class DataProductRepository(CRUDBase[DataProductDb, DataProductCreate, DataProdu
         logger.debug(f"Fetching DataProducts without project assignment with skip: {skip}, limit: {limit}")
         try:
             return db.query(self.model).options(
-                selectinload(self.model.info),
+                joinedload(self.model.info),
                 selectinload(self.model.inputPorts),
                 selectinload(self.model.outputPorts),
+                raiseload('*'),
             ).filter(self.model.project_id.is_(None)).offset(skip).limit(limit).all()
         except Exception as e:
             logger.error(f"Database error fetching DataProducts without project: {e}", exc_info=True)
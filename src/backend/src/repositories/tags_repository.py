@@ -294,8 +294,15 @@ class EntityTagAssociationRepository(CRUDBase[EntityTagAssociationDb, BaseModel,
         )
     
     def get_assigned_tags_for_entity(self, db: Session, *, entity_id: str, entity_type: str) -> List[AssignedTag]:
+        return self.get_assigned_tags_for_entities(db, entity_ids=[entity_id], entity_type=entity_type).get(entity_id, [])
+
+    def get_assigned_tags_for_entities(self, db: Session, *, entity_ids: List[str], entity_type: str) -> Dict[str, List[AssignedTag]]:
+        """Returns the assigned tags of many entities in one query, keyed by entity id (untagged entities are absent)."""
+        if not entity_ids:
+            return {}
         results = (
             db.query(
+                EntityTagAssociationDb.entity_id,
                 TagDb.id,
                 TagDb.name,
                 TagDb.namespace_id,
@@ -308,16 +315,16 @@ class EntityTagAssociationRepository(CRUDBase[EntityTagAssociationDb, BaseModel,
             .join(EntityTagAssociationDb, TagDb.id == EntityTagAssociationDb.tag_id)
             .join(TagNamespaceDb, TagDb.namespace_id == TagNamespaceDb.id)
             .filter(
-                EntityTagAssociationDb.entity_id == entity_id,
+                EntityTagAssociationDb.entity_id.in_(entity_ids),
                 EntityTagAssociationDb.entity_type == entity_type
             )
             .all()
         )
-        
-        assigned_tags = []
+
+        assigned_tags: Dict[str, List[AssignedTag]] = {}
         for row in results:
             fqn = f"{row.namespace_name}{TAG_NAMESPACE_SEPARATOR}{row.name}"
-            assigned_tags.append(
+            assigned_tags.setdefault(row.entity_id, []).append(
                 AssignedTag(
                     tag_id=row.id,
                     tag_name=row.name,
@@ -1,10 +1,14 @@
+import json
 import logging
+from typing import Any
 
 from databricks.sdk import WorkspaceClient
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 
 from src.common.workspace_client import get_workspace_client
 from src.controller.catalog_commander_manager import CatalogCommanderManager
+from src.models.catalog_commander import CatalogNode
 # Import permission checker and feature level
 from src.common.authorization import PermissionChecker
 from src.common.features import FeatureAccessLevel
@@ -19,6 +23,24 @@ router = APIRouter(prefix="/api", tags=["catalog-commander"])
 # Define the feature ID for permission checks
 CATALOG_COMMANDER_FEATURE_ID = 'catalog-commander'
 
+class CatalogNodeResponse(JSONResponse):
+    """JSON response for lists of CatalogNode.
+
+    Each node is turned into its dict form only while it is being encoded, so the
+    listing is never copied into a second list of dicts (or walked by jsonable_encoder).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(
+            content,
+            default=CatalogNode.to_dict,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
 # Modify dependency injector to return manager (no auth check needed here)
 def get_catalog_manager(client: WorkspaceClient = Depends(get_workspace_client)) -> CatalogCommanderManager:
     """Get a configured catalog commander manager instance.
@@ -38,9 +60,9 @@ async def list_catalogs(catalog_manager: CatalogCommanderManager = Depends(get_c
     """List all catalogs in the Databricks workspace."""
     try:
         logger.info("Starting to fetch catalogs")
-        catalogs = catalog_manager.list_catalogs()
+        catalogs = await catalog_manager.list_catalogs_async()
         logger.info(f"Successfully fetched {len(catalogs)} catalogs")
-        return catalogs
+        return CatalogNodeResponse(content=catalogs)
     except Exception as e:
         error_msg = f"Failed to fetch catalogs: {e!s}"
         logger.error(error_msg, exc_info=True)
@@ -54,9 +76,9 @@ async def list_schemas(
     """List all schemas in a catalog."""
     try:
         logger.info(f"Fetching schemas for catalog: {catalog_name}")
-        schemas = catalog_manager.list_schemas(catalog_name)
+        schemas = await catalog_manager.list_schemas_async(catalog_name)
         logger.info(f"Successfully fetched {len(schemas)} schemas for catalog {catalog_name}")
-        return schemas
+        return CatalogNodeResponse(content=schemas)
     except Exception as e:
         error_msg = f"Failed to fetch schemas for catalog {catalog_name}: {e!s}"
         logger.error(error_msg, exc_info=True)
@@ -71,9 +93,9 @@ async def list_tables(
     """List all tables in a schema."""
     try:
         logger.info(f"Fetching tables for schema: {catalog_name}.{schema_name}")
-        tables = catalog_manager.list_tables(catalog_name, schema_name)
+        tables = await catalog_manager.list_tables_async(catalog_name, schema_name)
         logger.info(f"Successfully fetched {len(tables)} tables for schema {catalog_name}.{schema_name}")
-        return tables
+        return CatalogNodeResponse(content=tables)
     except Exception as e:
         error_msg = f"Failed to fetch tables for schema {catalog_name}.{schema_name}: {e!s}"
         logger.error(error_msg, exc_info=True)
@@ -88,9 +110,9 @@ async def list_views(
     """List all views in a schema."""
     try:
         logger.info(f"Fetching views for schema: {catalog_name}.{schema_name}")
-        views = catalog_manager.list_views(catalog_name, schema_name)
+        views = await catalog_manager.list_views_async(catalog_name, schema_name)
         logger.info(f"Successfully fetched {len(views)} views for schema {catalog_name}.{schema_name}")
-        return views
+        return CatalogNodeResponse(content=views)
     except Exception as e:
         error_msg = f"Failed to fetch views for schema {catalog_name}.{schema_name}: {e!s}"
         logger.error(error_msg, exc_info=True)
@@ -105,9 +127,9 @@ async def list_functions(
     """List all functions in a schema."""
     try:
         logger.info(f"Fetching functions for schema: {catalog_name}.{schema_name}")
-        functions = catalog_manager.list_functions(catalog_name, schema_name)
+        functions = await catalog_manager.list_functions_async(catalog_name, schema_name)
         logger.info(f"Successfully fetched {len(functions)} functions for schema {catalog_name}.{schema_name}")
-        return functions
+        return CatalogNodeResponse(content=functions)
     except Exception as e:
         error_msg = f"Failed to fetch functions for schema {catalog_name}.{schema_name}: {e!s}"
         logger.error(error_msg, exc_info=True)
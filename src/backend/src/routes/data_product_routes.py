@@ -1,16 +1,18 @@
+import asyncio
+import json
 import logging
 import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 import yaml
-from fastapi import APIRouter, HTTPException, UploadFile, File, Body, Depends, Request, BackgroundTasks
+from fastapi import APIRouter, HTTPException, UploadFile, File, Body, Depends, Request, BackgroundTasks, Response
 from pydantic import ValidationError
 import uuid
 from sqlalchemy.orm import Session
 
 from src.controller.data_products_manager import DataProductsManager
-from src.models.data_products import DataProduct, GenieSpaceRequest, NewVersionRequest
+from src.models.data_products import DATA_PRODUCT_LIST_ADAPTER, DataProduct, GenieSpaceRequest, NewVersionRequest
 from src.models.users import UserInfo
 from databricks.sdk.errors import PermissionDenied
 
@@ -36,6 +38,16 @@ router = APIRouter(prefix="/api", tags=["data-products"])
 
 DATA_PRODUCTS_FEATURE_ID = "data-products"
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only ship the pure-Python one
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header value matches the ETag (weak comparison, '*' matches anything)."""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(',')]
+    return '*' in candidates or etag in (value.removeprefix('W/') for value in candidates)
+
 def get_data_products_manager(
     request: Request # Inject Request
 ) -> DataProductsManager:
@@ -129,12 +141,12 @@ async def upload_data_products(
     }
 
     try:
-        content = await file.read()
+        # YAML is parsed by libyaml straight from the spooled upload stream; both parsers
+        # run in a worker thread so they don't block the event loop.
         if file.filename.endswith('.yaml'):
-            data = yaml.safe_load(content)
+            data = await asyncio.to_thread(yaml.load, file.file, Loader=YAML_LOADER)
         else:
-            import json
-            data = json.loads(content)
+            data = await asyncio.to_thread(json.load, file.file)
             
         data_list: List[Dict[str, Any]]
         if isinstance(data, dict):
@@ -148,45 +160,57 @@ async def upload_data_products(
             raise exc
 
         errors_for_response_detail = [] 
+        candidates: List[Dict[str, Any]] = []
         for product_data in data_list:
              if not isinstance(product_data, dict):
                  err_detail = {"error": "Skipping non-dictionary item within list/array.", "item_preview": str(product_data)[:100]}
                  errors_for_response_detail.append(err_detail)
                  processing_errors_for_audit.append(err_detail)
                  continue
-             
-             product_id_in_data = product_data.get('id')
+             if not product_data.get('id'):
+                 generated_id = str(uuid.uuid4())
+                 product_data['id'] = generated_id
+                 logger.info(f"Generated ID {generated_id} for uploaded product lacking one.")
+             candidates.append(product_data)
+
+        # One query for all IDs and one validation pass for the whole batch
+        existing_ids = manager.get_existing_product_ids([p['id'] for p in candidates])
+        validated_models: Optional[List[DataProduct]] = None
+        validation_errors: Dict[int, List[Dict[str, Any]]] = {}
+        try:
+            validated_models = DATA_PRODUCT_LIST_ADAPTER.validate_python(candidates)
+        except ValidationError as e_val:
+            for err in e_val.errors():
+                validation_errors.setdefault(err['loc'][0], []).append({**err, 'loc': err['loc'][1:]})
+
+        for position, product_data in enumerate(candidates):
+             product_id_in_data = product_data['id']
              
              try:
-                 if not product_id_in_data:
-                     generated_id = str(uuid.uuid4())
-                     product_data['id'] = generated_id
-                     logger.info(f"Generated ID {generated_id} for uploaded product lacking one.")
-                     product_id_in_data = generated_id 
-                 
-                 if product_id_in_data and manager.get_product(product_id_in_data):
+                 if product_id_in_data in existing_ids:
                      err_detail = {"id": product_id_in_data, "error": "Product with this ID already exists. Skipping."}
                      errors_for_response_detail.append(err_detail)
                      processing_errors_for_audit.append(err_detail)
                      continue
                  
-                 try:
-                    _ = DataProduct(**product_data)
-                 except ValidationError as e_val:
-                     logger.error(f"Validation failed for uploaded product (ID: {product_id_in_data}): {e_val}")
-                     err_detail = {"id": product_id_in_data, "error": f"Validation failed: {e_val.errors() if hasattr(e_val, 'errors') else str(e_val)}"}
+                 if position in validation_errors:
+                     logger.error(f"Validation failed for uploaded product (ID: {product_id_in_data}): {validation_errors[position]}")
+                     err_detail = {"id": product_id_in_data, "error": f"Validation failed: {validation_errors[position]}"}
                      errors_for_response_detail.append(err_detail)
                      processing_errors_for_audit.append(err_detail)
                      continue 
 
-                 created_product = manager.create_product(product_data)
+                 if validated_models is not None:
+                     created_product = manager.create_product_from_model(validated_models[position])
+                 else:
+                     created_product = manager.create_product(product_data)
+                 existing_ids.add(product_id_in_data)
                  created_products_for_response.append(created_product)
                  if created_product and hasattr(created_product, 'id'):
                     created_ids_for_audit.append(str(created_product.id))
                  
              except Exception as e_item:
-                 error_id_for_log = product_id_in_data if product_id_in_data else 'N/A_CreationFailure'
-                 err_detail = {"id": error_id_for_log, "error": f"Creation failed: {e_item!s}"}
+                 err_detail = {"id": product_id_in_data, "error": f"Creation failed: {e_item!s}"}
                  errors_for_response_detail.append(err_detail)
                  processing_errors_for_audit.append(err_detail)
 
@@ -258,7 +282,10 @@ async def get_data_products(
         logger.info("Retrieving all data products via get_data_products route...")
         products = manager.list_products()
         logger.info(f"Retrieved {len(products)} data products")
-        return [p.model_dump() for p in products]
+        # Serialize straight to JSON bytes instead of building dicts for FastAPI to re-encode.
+        # Note: pydantic writes UTC datetimes with a 'Z' suffix (2024-01-01T00:00:00Z), where the
+        # former jsonable_encoder path wrote '+00:00'; both are ISO 8601, clients must accept either.
+        return Response(content=DATA_PRODUCT_LIST_ADAPTER.dump_json(products), media_type="application/json")
     except Exception as e:
         error_msg = f"Error retrieving data products: {e!s}"
         logger.exception(error_msg)
@@ -284,7 +311,7 @@ async def create_data_product(
         logger.info(f"Received raw payload for creation: {payload}")
         product_id = payload.get('id')
 
-        if product_id and manager.get_product(product_id):
+        if product_id and manager.get_existing_product_ids([product_id]):
              # response_status_code = 409 # Handled by HTTPException
              raise HTTPException(status_code=409, detail=f"Data product with ID {product_id} already exists.")
 
@@ -306,10 +333,8 @@ async def create_data_product(
              # details_for_audit["validation_error"] = error_details
              raise HTTPException(status_code=422, detail=error_details)
 
-        # The manager.create_product method should handle its own DB session if needed
-        # or take db as an argument if it cannot get it from its own initialization.
-        # Assuming manager can handle its session, or it's passed if required (e.g. via app.state or another Depends).
-        created_product = manager.create_product(payload) 
+        # Pass the validated model through so the manager does not validate the payload again
+        created_product = manager.create_product_from_model(validated_model)
         
         # --- Add created ID to request.state for audit logging --- 
         if created_product and hasattr(created_product, 'id'):
@@ -582,14 +607,27 @@ async def delete_data_product(
 @router.get('/data-products/{product_id}', response_model=Any)
 async def get_data_product(
     product_id: str,
+    request: Request,
+    response: Response,
     manager: DataProductsManager = Depends(get_data_products_manager),
     _: bool = Depends(PermissionChecker(DATA_PRODUCTS_FEATURE_ID, FeatureAccessLevel.READ_ONLY))
 ) -> Any: # Return Any to allow returning a dict
     try:
+        # Cheap change check first: an unchanged product is answered without loading or serializing it
+        etag = manager.get_product_etag(product_id)
+        if not etag:
+            raise HTTPException(status_code=404, detail="Data product not found")
+        cache_headers = {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=cache_headers)
+
         product = manager.get_product(product_id)
         if not product:
             raise HTTPException(status_code=404, detail="Data product not found")
+        response.headers.update(cache_headers)
         return product.model_dump(exclude={'created_at', 'updated_at'}, exclude_none=True, exclude_unset=True)
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -0,0 +1,52 @@
+"""
+Unit tests for the PermissionChecker dependency.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import HTTPException
+from starlette.datastructures import State
+
+from src.common.authorization import PermissionChecker
+from src.common.features import FeatureAccessLevel
+from src.models.users import UserInfo
+
+
+class TestPermissionChecker:
+    """Test suite for PermissionChecker."""
+
+    @pytest.fixture
+    def request_obj(self):
+        request = Mock()
+        request.state = State()
+        return request
+
+    @pytest.fixture
+    def user(self):
+        return UserInfo(email="alice@example.com", username="alice", user="alice", ip=None, groups=["users"])
+
+    @pytest.fixture
+    def auth_manager(self):
+        auth = Mock()
+        auth.get_user_effective_permissions.return_value = {"data-products": FeatureAccessLevel.READ_WRITE}
+        auth.has_permission.side_effect = lambda perms, feature, level: feature in perms
+        return auth
+
+    def test_effective_permissions_resolved_once_per_request(self, request_obj, user, auth_manager):
+        """Test that several checkers in one request share the permission lookup."""
+        overrides = AsyncMock(return_value=None)
+        with patch("src.common.authorization.get_user_team_role_overrides", overrides):
+            asyncio.run(PermissionChecker("data-products", FeatureAccessLevel.READ_ONLY)(request_obj, user, auth_manager))
+            asyncio.run(PermissionChecker("data-products", FeatureAccessLevel.READ_WRITE)(request_obj, user, auth_manager))
+
+        assert overrides.await_count == 1
+        assert auth_manager.get_user_effective_permissions.call_count == 1
+        assert auth_manager.has_permission.call_count == 2
+
+    def test_denied_permission_raises_403(self, request_obj, user, auth_manager):
+        """Test that a cached lookup still denies features the user lacks."""
+        with patch("src.common.authorization.get_user_team_role_overrides", AsyncMock(return_value=None)):
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(PermissionChecker("settings", FeatureAccessLevel.ADMIN)(request_obj, user, auth_manager))
+        assert exc_info.value.status_code == 403
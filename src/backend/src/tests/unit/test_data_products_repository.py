@@ -0,0 +1,153 @@
+"""
+Unit tests for DataProductRepository loading and write paths.
+"""
+
+from contextlib import contextmanager
+import uuid
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from src.db_models.data_products import DataProductDb
+from src.db_models.tags import EntityTagAssociationDb, TagDb, TagNamespaceDb
+from src.models.data_products import DataProduct
+from src.repositories.data_products_repository import data_product_repo
+from src.repositories.tags_repository import entity_tag_repo
+
+
+def _product(product_id, port_count=1):
+    suffixes = [""] + [f"-{i}" for i in range(1, port_count)]
+    return DataProduct.model_validate({
+        "id": product_id,
+        "version": "1.0.0",
+        "productType": "source",
+        "info": {"title": f"Product {product_id}"},
+        "inputPorts": [{"id": f"{product_id}-in{s}", "name": "in", "sourceSystemId": "src"} for s in suffixes],
+        "outputPorts": [{"id": f"{product_id}-out{s}", "name": "out"} for s in suffixes],
+    })
+
+
+@contextmanager
+def _count_queries(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, executemany))
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestDataProductRepository:
+    """Test suite for DataProductRepository."""
+
+    @pytest.fixture
+    def products(self, db_session):
+        for product_id in ("p1", "p2", "p3"):
+            data_product_repo.create(db_session, obj_in=_product(product_id))
+        db_session.flush()
+        db_session.expunge_all()
+
+    def test_get_multi_query_count_is_independent_of_row_count(self, db_session, products):
+        with _count_queries(db_session) as statements:
+            loaded = data_product_repo.get_multi(db_session)
+            api_models = [DataProduct.model_validate(p, from_attributes=True) for p in loaded]
+
+        assert len(api_models) == 3
+        assert all(len(p.inputPorts) == 1 and len(p.outputPorts) == 1 for p in api_models)
+        # products joined to info, then input ports and output ports, however many products there are
+        assert len(statements) == 3
+
+    def test_create_inserts_each_port_table_in_one_batch(self, db_session):
+        with _count_queries(db_session) as statements:
+            data_product_repo.create(db_session, obj_in=_product("p5", port_count=5))
+
+        inserts = [(statement.split("(")[0].strip(), executemany) for statement, executemany in statements]
+        assert inserts == [
+            ("INSERT INTO data_products", False),
+            ("INSERT INTO data_product_info", False),
+            ("INSERT INTO input_ports", True),
+            ("INSERT INTO output_ports", True),
+        ]
+
+    def test_relationships_are_never_lazy_loaded(self, db_session, products):
+        product = db_session.query(DataProductDb).filter(DataProductDb.id == "p1").one()
+
+        with pytest.raises(InvalidRequestError):
+            product.inputPorts
+        with pytest.raises(InvalidRequestError):
+            product.info
+
+    def test_create_returns_populated_relationships(self, db_session):
+        created = data_product_repo.create(db_session, obj_in=_product("p4"))
+
+        api_model = DataProduct.model_validate(created, from_attributes=True)
+        assert api_model.info.title == "Product p4"
+        assert [p.id for p in api_model.outputPorts] == ["p4-out"]
+
+    def test_get_search_rows_selects_only_indexed_columns(self, db_session, products):
+        with _count_queries(db_session) as statements:
+            rows = data_product_repo.get_search_rows(db_session)
+
+        assert sorted((row.id, row.title) for row in rows) == [
+            ("p1", "Product p1"), ("p2", "Product p2"), ("p3", "Product p3"),
+        ]
+        assert rows[0].product_type == "source"
+        assert len(statements) == 1
+
+    def test_update_replaces_ports(self, db_session, products):
+        product = data_product_repo.get(db_session, "p1")
+        payload = _product("p1", port_count=2).model_dump()
+        payload["outputPorts"][0]["tags"] = [{"tag_fqn": "default/pii"}]
+
+        updated = data_product_repo.update(db_session, db_obj=product, obj_in=payload)
+
+        assert sorted(port.id for port in updated.inputPorts) == ["p1-in", "p1-in-1"]
+        assert sorted(port.id for port in updated.outputPorts) == ["p1-out", "p1-out-1"]
+
+    def test_repr_never_emits_sql(self, db_session, products):
+        product = db_session.query(DataProductDb).filter(DataProductDb.id == "p1").one()
+        db_session.expire(product)
+
+        with _count_queries(db_session) as statements:
+            text = repr(product)
+
+        assert text == "<DataProductDb(id='p1')>"
+        assert statements == []
+        assert repr(DataProductDb(id="new")) == "<DataProductDb(id='new')>"
+
+    def test_change_marker_tracks_tag_assignments(self, db_session, products):
+        assert data_product_repo.get_change_marker(db_session, "missing") is None
+        before = data_product_repo.get_change_marker(db_session, "p1")
+
+        db_session.add(EntityTagAssociationDb(tag_id=uuid.uuid4(), entity_id="p1", entity_type="data_product"))
+        db_session.flush()
+
+        after = data_product_repo.get_change_marker(db_session, "p1")
+        assert after != before
+
+    def test_tags_for_many_products_load_in_one_query(self, db_session, products):
+        namespace = TagNamespaceDb(name="default")
+        db_session.add(namespace)
+        db_session.flush()
+        tag = TagDb(name="pii", namespace_id=namespace.id)
+        db_session.add(tag)
+        db_session.flush()
+        for product_id in ("p1", "p2"):
+            db_session.add(EntityTagAssociationDb(tag_id=tag.id, entity_id=product_id, entity_type="data_product"))
+        db_session.flush()
+
+        with _count_queries(db_session) as statements:
+            tags_by_product = entity_tag_repo.get_assigned_tags_for_entities(
+                db_session, entity_ids=["p1", "p2", "p3"], entity_type="data_product"
+            )
+
+        assert {product_id: [t.fully_qualified_name for t in tags] for product_id, tags in tags_by_product.items()} == {
+            "p1": ["default/pii"], "p2": ["default/pii"],
+        }
+        assert len(statements) == 1
@@ -0,0 +1,100 @@
+"""
+Unit tests for SearchManager prefix search.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+
+from src.common.search_interfaces import SearchableAsset, SearchIndexItem
+from src.controller.search_manager import SearchManager
+from src.models.users import UserInfo
+
+
+class _StaticAsset(SearchableAsset):
+    def __init__(self, items):
+        self.items = items
+
+    def get_search_index_items(self):
+        return self.items
+
+
+def _item(item_id, title, description=None, tags=None):
+    return SearchIndexItem(
+        id=item_id,
+        type="data-product",
+        title=title,
+        description=description,
+        link=f"/data-products/{item_id}",
+        tags=tags or [],
+        feature_id="data-products",
+    )
+
+
+class TestSearchManager:
+    """Test suite for SearchManager."""
+
+    @pytest.fixture
+    def manager(self):
+        return SearchManager([_StaticAsset([
+            _item("1", "Customer Orders", description="Daily order facts", tags=["Sales"]),
+            _item("2", "Inventory", description="Customer stock levels"),
+            _item("3", "Shipments", tags=["logistics", "sales-ops"]),
+        ])])
+
+    @pytest.fixture
+    def auth_manager(self):
+        auth = Mock()
+        auth.get_user_effective_permissions.return_value = {}
+        auth.has_permission.return_value = True
+        return auth
+
+    @pytest.fixture
+    def user(self):
+        return UserInfo(username="alice", email="alice@example.com", user="alice", ip=None, groups=["users"])
+
+    def _ids(self, manager, query, auth_manager, user):
+        return [item.id for item in manager.search(query, auth_manager, user)]
+
+    def test_prefix_matches_title_description_and_tags(self, manager, auth_manager, user):
+        """Test case-insensitive prefix matches across all searchable fields, in index order."""
+        assert self._ids(manager, "CUST", auth_manager, user) == ["1", "2"]
+        assert self._ids(manager, "sales", auth_manager, user) == ["1", "3"]
+        assert self._ids(manager, "ship", auth_manager, user) == ["3"]
+
+    def test_matches_are_prefix_only(self, manager, auth_manager, user):
+        """Test that substrings in the middle of a field do not match."""
+        assert self._ids(manager, "orders", auth_manager, user) == []
+        assert self._ids(manager, "", auth_manager, user) == []
+
+    def test_rebuild_picks_up_new_items(self, manager, auth_manager, user):
+        """Test that build_index replaces the prefix index."""
+        manager.searchable_managers.append(_StaticAsset([_item("4", "Customs Declarations")]))
+        manager.build_index()
+        assert self._ids(manager, "custom", auth_manager, user) == ["1", "2", "4"]
+
+    def test_build_index_skips_failing_manager(self, auth_manager, user):
+        """Test that one failing manager does not prevent indexing the others."""
+        failing = Mock(spec=SearchableAsset)
+        failing.get_search_index_items.side_effect = RuntimeError("boom")
+        manager = SearchManager([failing, _StaticAsset([_item("1", "Customer Orders")])])
+        assert self._ids(manager, "cust", auth_manager, user) == ["1"]
+
+    def test_managers_sharing_a_session_run_in_one_worker(self):
+        """Test that managers holding the same db session are fetched on the same thread."""
+        session = object()
+        seen_threads = []
+
+        class _SessionAsset(_StaticAsset):
+            def __init__(self, items):
+                super().__init__(items)
+                self._db = session
+
+            def get_search_index_items(self):
+                seen_threads.append(threading.get_ident())
+                return self.items
+
+        manager = SearchManager([_SessionAsset([_item("1", "A")]), _SessionAsset([_item("2", "B")])])
+        assert [item.id for item in manager.index] == ["1", "2"]
+        assert len(set(seen_threads)) == 1
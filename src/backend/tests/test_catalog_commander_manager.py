@@ -1,5 +1,7 @@
 """Tests for CatalogCommanderManager schema inference functionality."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, MagicMock
 from typing import Dict, Any
@@ -7,6 +9,14 @@ from typing import Dict, Any
 from src.controller.catalog_commander_manager import CatalogCommanderManager
 
 
+@pytest.fixture(autouse=True)
+def clear_listing_cache():
+    """Listings are cached at module level; isolate every test."""
+    CatalogCommanderManager.invalidate_cache()
+    yield
+    CatalogCommanderManager.invalidate_cache()
+
+
 class TestCatalogCommanderManagerSchemaInference:
     """Test schema inference and UC metadata handling."""
 
@@ -253,4 +263,114 @@ class TestCatalogCommanderManagerSchemaInference:
         mock_workspace_client.api_client.do.side_effect = Exception("REST API error")
 
         with pytest.raises(Exception, match="REST API error"):
-            catalog_manager.get_dataset('catalog.schema.table')
\ No newline at end of file
+            catalog_manager.get_dataset('catalog.schema.table')
+
+class TestCatalogCommanderManagerListing:
+    """Test catalog/schema listing helpers."""
+
+    @pytest.fixture
+    def mock_workspace_client(self):
+        """Create a mock workspace client with two catalogs."""
+        client = Mock()
+        catalogs = [Mock(), Mock()]
+        catalogs[0].name = 'cat_a'
+        catalogs[1].name = 'cat_b'
+        client.catalogs.list.return_value = catalogs
+        return client
+
+    @pytest.fixture
+    def catalog_manager(self, mock_workspace_client):
+        """Create CatalogCommanderManager with mocked client."""
+        return CatalogCommanderManager(mock_workspace_client)
+
+    def test_list_all_populates_schemas_per_catalog(self, catalog_manager, mock_workspace_client):
+        """Test that list_all attaches each catalog's schemas as children."""
+        def list_schemas(catalog_name):
+            schema = Mock()
+            schema.name = f"{catalog_name}_schema"
+            return [schema]
+        mock_workspace_client.schemas.list.side_effect = list_schemas
+
+        result = asyncio.run(catalog_manager.list_all())
+
+        assert [c['name'] for c in result] == ['cat_a', 'cat_b']
+        assert result[0]['children'][0]['id'] == 'cat_a.cat_a_schema'
+        assert result[1]['children'][0]['id'] == 'cat_b.cat_b_schema'
+
+    def test_list_all_tolerates_failing_catalog(self, catalog_manager, mock_workspace_client):
+        """Test that one failing catalog does not fail the whole listing."""
+        def list_schemas(catalog_name):
+            if catalog_name == 'cat_a':
+                raise Exception("Permission denied")
+            schema = Mock()
+            schema.name = 'ok'
+            return [schema]
+        mock_workspace_client.schemas.list.side_effect = list_schemas
+
+        result = asyncio.run(catalog_manager.list_all())
+
+        assert result[0]['children'] == []
+        assert result[1]['children'][0]['name'] == 'ok'
+
+    def test_list_schemas_is_cached_until_invalidated(self, catalog_manager, mock_workspace_client):
+        """Test that repeated listings are served from the TTL cache."""
+        mock_workspace_client.schemas.list.return_value = []
+
+        catalog_manager.list_schemas('cat_a')
+        CatalogCommanderManager(mock_workspace_client).list_schemas('cat_a')
+        assert mock_workspace_client.schemas.list.call_count == 1
+
+        catalog_manager.list_schemas('cat_b')
+        assert mock_workspace_client.schemas.list.call_count == 2
+
+        CatalogCommanderManager.invalidate_cache()
+        catalog_manager.list_schemas('cat_a')
+        assert mock_workspace_client.schemas.list.call_count == 3
+
+    def test_listing_cache_evicts_least_recently_used(self, catalog_manager, mock_workspace_client, monkeypatch):
+        """Test that the listing cache is bounded and evicts the least recently used entry."""
+        monkeypatch.setattr('src.controller.catalog_commander_manager.LISTING_CACHE_MAX_ENTRIES', 2)
+        mock_workspace_client.schemas.list.return_value = []
+
+        catalog_manager.list_schemas('cat_a')
+        catalog_manager.list_schemas('cat_b')
+        catalog_manager.list_schemas('cat_a')  # refreshes cat_a, leaving cat_b least recently used
+        catalog_manager.list_schemas('cat_c')
+        assert mock_workspace_client.schemas.list.call_count == 3
+
+        catalog_manager.list_schemas('cat_a')
+        assert mock_workspace_client.schemas.list.call_count == 3
+        catalog_manager.list_schemas('cat_b')
+        assert mock_workspace_client.schemas.list.call_count == 4
+
+    def test_list_tables_and_views_share_one_fetch(self, catalog_manager, mock_workspace_client):
+        """Test that list_tables and list_views are served from a single slim REST listing."""
+        mock_workspace_client.api_client.do.return_value = {
+            'tables': [
+                {'name': 'orders', 'table_type': 'MANAGED'},
+                {'name': 'orders_v', 'table_type': 'VIEW'},
+            ]
+        }
+
+        tables = catalog_manager.list_tables('cat_a', 'sales')
+        views = catalog_manager.list_views('cat_a', 'sales')
+
+        assert [t.name for t in tables] == ['orders', 'orders_v']
+        assert [v.name for v in views] == ['orders_v']
+        assert views[0].type == 'view'
+        mock_workspace_client.api_client.do.assert_called_once()
+        query = mock_workspace_client.api_client.do.call_args.kwargs['query']
+        assert query['catalog_name'] == 'cat_a' and query['schema_name'] == 'sales'
+        assert query['omit_columns'] is True and query['omit_properties'] is True
+
+    def test_list_tables_follows_pagination(self, catalog_manager, mock_workspace_client):
+        """Test that every page of the table listing is fetched."""
+        mock_workspace_client.api_client.do.side_effect = [
+            {'tables': [{'name': 'a', 'table_type': 'MANAGED'}], 'next_page_token': 'tok'},
+            {'tables': [{'name': 'b', 'table_type': 'EXTERNAL'}]},
+        ]
+
+        tables = catalog_manager.list_tables('cat_a', 'sales')
+
+        assert [t.id for t in tables] == ['cat_a.sales.a', 'cat_a.sales.b']
+        assert mock_workspace_client.api_client.do.call_args.kwargs['query']['page_token'] == 'tok'